@@ -14,17 +14,23 @@ Drift types:
 import json
 import logging
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal
 
+import cv2
 import numpy as np
-from PIL import Image, ImageFilter
+from PIL import Image
 
 logger = logging.getLogger(__name__)
 
 DriftType = Literal["brightness", "noise", "blur", "mixed"]
 
+# Module-level generator so RNG initialisation is paid once; simulate_drift
+# reseeds it for reproducible batches.
+_rng = np.random.default_rng()
+
 
 def apply_brightness(img: Image.Image, factor: float) -> Image.Image:
     """Multiply pixel values by factor  (< 1 = darker, > 1 = brighter)."""
@@ -33,17 +39,38 @@ def apply_brightness(img: Image.Image, factor: float) -> Image.Image:
     return Image.fromarray(arr)
 
 
-def apply_noise(img: Image.Image, std: float) -> Image.Image:
-    """Add zero-mean Gaussian noise with the given standard deviation."""
-    arr = np.array(img, dtype=np.float32)
-    noise = np.random.normal(0, std, arr.shape)
-    arr = np.clip(arr + noise, 0, 255).astype(np.uint8)
-    return Image.fromarray(arr)
+def apply_noise(
+    img: Image.Image,
+    std: float,
+    rng: np.random.Generator | None = None,
+) -> Image.Image:
+    """Add zero-mean Gaussian noise with the given standard deviation.
+
+    Pass ``rng`` for deterministic noise; the module generator is used
+    otherwise.
+    """
+    arr = np.asarray(img)
+    # Draw, scale, shift, and clip in one float32 buffer instead of the
+    # float64 noise + sum + clip temporaries the naive version allocates.
+    buf = np.empty(arr.shape, dtype=np.float32)
+    (rng if rng is not None else _rng).standard_normal(out=buf, dtype=np.float32)
+    buf *= std
+    buf += arr
+    np.clip(buf, 0, 255, out=buf)
+    return Image.fromarray(buf.astype(np.uint8))
 
 
 def apply_blur(img: Image.Image, radius: float) -> Image.Image:
-    """Apply Gaussian blur."""
-    return img.filter(ImageFilter.GaussianBlur(radius=radius))
+    """Apply Gaussian blur (OpenCV's separable SIMD kernel).
+
+    ksize=(0, 0) lets OpenCV derive the kernel extent from sigma (~±3σ),
+    matching PIL's effective support; a fixed kernel would truncate the
+    Gaussian and weaken the blur.
+    """
+    if radius <= 0:
+        return img.copy()
+    arr = np.asarray(img)
+    return Image.fromarray(cv2.GaussianBlur(arr, (0, 0), sigmaX=radius))
 
 
 def _apply_transform(
@@ -69,6 +96,41 @@ def _apply_transform(
     return second(first(img))
 
 
+def _transform_batch(
+    batch: np.ndarray,
+    drift_type: DriftType,
+    severity: float,
+) -> np.ndarray:
+    """Apply the drift transform to a stacked uint8 batch of shape (N, H, W, 3).
+
+    Brightness and noise broadcast across the whole batch; blur runs one
+    cv2.GaussianBlur per image (OpenCV has no batched variant); mixed chains
+    two random per-image transforms, matching the single-image dispatch.
+    """
+    if drift_type == "brightness":
+        factor = 1.0 + severity
+        return np.clip(batch.astype(np.float32) * factor, 0, 255).astype(np.uint8)
+    if drift_type == "noise":
+        buf = np.empty(batch.shape, dtype=np.float32)
+        _rng.standard_normal(out=buf, dtype=np.float32)
+        buf *= severity * 50
+        buf += batch
+        np.clip(buf, 0, 255, out=buf)
+        return buf.astype(np.uint8)
+    if drift_type == "blur":
+        radius = severity * 5
+        if radius <= 0:
+            return batch.copy()
+        # ksize=(0, 0) derives the kernel from sigma — see apply_blur
+        return np.stack([cv2.GaussianBlur(img, (0, 0), sigmaX=radius) for img in batch])
+
+    out = np.empty_like(batch)
+    for i in range(batch.shape[0]):
+        drifted = _apply_transform(Image.fromarray(batch[i]), "mixed", severity)
+        out[i] = np.asarray(drifted)
+    return out
+
+
 def simulate_drift(
     src_dir: Path,
     dst_dir: Path,
@@ -96,8 +158,9 @@ def simulate_drift(
     if not img_dir.exists():
         raise FileNotFoundError(f"No images at {img_dir}. Run prepare_dataset first.")
 
+    global _rng
     random.seed(seed)
-    np.random.seed(seed)
+    _rng = np.random.default_rng(seed)
 
     all_images = sorted(img_dir.glob("*.jpg"))
     sample_size = max(1, int(len(all_images) * sample_fraction))
@@ -108,10 +171,22 @@ def simulate_drift(
     batch_img_dir = batch_dir / "images"
     batch_img_dir.mkdir(parents=True, exist_ok=True)
 
-    for img_path in sampled:
-        img = Image.open(img_path).convert("RGB")
-        drifted = _apply_transform(img, drift_type, severity)
-        drifted.save(batch_img_dir / img_path.name)
+    workers = min(8, len(sampled))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        images = list(pool.map(lambda p: cv2.imread(str(p), cv2.IMREAD_COLOR), sampled))
+
+    out_paths = [str(batch_img_dir / p.name) for p in sampled]
+    if len({img.shape for img in images}) == 1:
+        # Uniform sizes (the normal case for processed data): transform the
+        # whole stack at once and write files from a thread pool.
+        drifted_batch = _transform_batch(np.stack(images), drift_type, severity)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(cv2.imwrite, out_paths, drifted_batch))
+    else:
+        # Heterogeneous sizes cannot be stacked — transform per image.
+        for out_path, img in zip(out_paths, images, strict=True):
+            drifted = _apply_transform(Image.fromarray(img), drift_type, severity)
+            cv2.imwrite(out_path, np.asarray(drifted))
 
     metadata = {
         "timestamp": timestamp,
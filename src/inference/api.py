@@ -24,7 +24,7 @@ import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi import Depends, FastAPI, File, HTTPException, UploadFile
 from fastapi.responses import PlainTextResponse
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
@@ -79,6 +79,15 @@ MODEL_INFO = _get_or_create(Info, "active_model", "Currently loaded model metada
 _loader = ModelLoader()
 
 
+def get_loader() -> ModelLoader:
+    """FastAPI dependency returning the process-wide model loader.
+
+    Tests swap the loader via ``app.dependency_overrides[get_loader]`` instead
+    of patching the module global and rebuilding the client.
+    """
+    return _loader
+
+
 def _update_model_info() -> None:
     MODEL_INFO.info(
         {
@@ -156,13 +165,16 @@ class PredictResponse(BaseModel):
 
 
 @app.get("/health")
-async def health() -> dict:
-    return {"status": "ok", "model_loaded": _loader.is_loaded}
+async def health(loader: ModelLoader = Depends(get_loader)) -> dict:
+    return {"status": "ok", "model_loaded": loader.is_loaded}
 
 
 @app.post("/predict", response_model=PredictResponse)
-async def predict(file: UploadFile = File(...)) -> PredictResponse:
-    if not _loader.is_loaded:
+async def predict(
+    file: UploadFile = File(...),
+    loader: ModelLoader = Depends(get_loader),
+) -> PredictResponse:
+    if not loader.is_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
     start = time.perf_counter()
@@ -174,7 +186,7 @@ async def predict(file: UploadFile = File(...)) -> PredictResponse:
             tmp.write(await file.read())
             tmp_path = tmp.name
 
-        raw: list[LoaderDetection] = _loader.predict(tmp_path)
+        raw: list[LoaderDetection] = loader.predict(tmp_path)
         inference_ms = (time.perf_counter() - start) * 1000
 
         PREDICTIONS_TOTAL.inc()
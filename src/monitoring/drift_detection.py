@@ -12,8 +12,10 @@ run_drift_report         Compare reference vs. current image directories.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pandas as pd
 import yaml
@@ -21,6 +23,93 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# numba is an optional accelerator — the NumPy path below is the fallback.
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    _HAS_NUMBA = False
+
+# Uniform channel weights: grayscale here is the plain channel mean (the
+# original feature definition), not a perceptual luminance conversion.
+_GRAY_WEIGHTS = np.full(3, 1.0 / 3.0, dtype=np.float32)
+
+_FEATURE_COLUMNS = ("brightness_mean", "brightness_std", "contrast", "sharpness")
+
+
+if _HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _contrast_sharpness(gray: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Single-pass contrast + gradient-energy kernel over (N, H, W).
+
+        Streams each image once, accumulating the grayscale moments and the
+        central-difference gradient energy (matching ``np.gradient``) instead
+        of materialising the three temporaries the NumPy path allocates.
+        """
+        n, h, w = gray.shape
+        contrast = np.empty(n, dtype=np.float32)
+        sharpness = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            s = 0.0
+            s2 = 0.0
+            energy = 0.0
+            for y in range(h):
+                for x in range(w):
+                    v = gray[i, y, x]
+                    s += v
+                    s2 += v * v
+                    if h == 1:
+                        gy = 0.0
+                    elif y == 0:
+                        gy = gray[i, 1, x] - gray[i, 0, x]
+                    elif y == h - 1:
+                        gy = gray[i, y, x] - gray[i, y - 1, x]
+                    else:
+                        gy = (gray[i, y + 1, x] - gray[i, y - 1, x]) * 0.5
+                    if w == 1:
+                        gx = 0.0
+                    elif x == 0:
+                        gx = gray[i, y, 1] - gray[i, y, 0]
+                    elif x == w - 1:
+                        gx = gray[i, y, x] - gray[i, y, x - 1]
+                    else:
+                        gx = (gray[i, y, x + 1] - gray[i, y, x - 1]) * 0.5
+                    energy += gy * gy + gx * gx
+            pixels = h * w
+            mean = s / pixels
+            var = s2 / pixels - mean * mean
+            contrast[i] = np.sqrt(max(var, 0.0))
+            sharpness[i] = energy / pixels
+        return contrast, sharpness
+
+
+def _decode_bgr(path: Path) -> np.ndarray:
+    """Decode an image to a BGR uint8 array, falling back to PIL."""
+    img = cv2.imread(str(path), cv2.IMREAD_COLOR)
+    if img is None:
+        img = np.asarray(Image.open(path).convert("RGB"))[:, :, ::-1]
+    return img
+
+
+def _batch_features(batch: np.ndarray) -> dict[str, np.ndarray]:
+    """Feature columns for one (N, H, W, 3) float32 batch of uint8 values."""
+    batch *= np.float32(1.0 / 255.0)
+    gray = batch @ _GRAY_WEIGHTS
+    if _HAS_NUMBA:
+        contrast, sharpness = _contrast_sharpness(np.ascontiguousarray(gray))
+    else:
+        gy, gx = np.gradient(gray, axis=(1, 2))
+        contrast = gray.std(axis=(1, 2))
+        sharpness = (gy**2 + gx**2).mean(axis=(1, 2))
+    return {
+        "brightness_mean": batch.mean(axis=(1, 2, 3)),
+        "brightness_std": batch.std(axis=(1, 2, 3)),
+        "contrast": contrast,
+        "sharpness": sharpness,
+    }
+
 
 def extract_image_features(image_paths: list[Path]) -> pd.DataFrame:
     """Compute per-image statistics used as drift features.
@@ -42,20 +131,25 @@ def extract_image_features(image_paths: list[Path]) -> pd.DataFrame:
     Returns:
         DataFrame with one row per image and four feature columns.
     """
-    rows = []
-    for path in image_paths:
-        arr = np.array(Image.open(path).convert("RGB"), dtype=np.float32) / 255.0
-        gray = arr.mean(axis=2)
-        gy, gx = np.gradient(gray)
-        rows.append(
-            {
-                "brightness_mean": float(arr.mean()),
-                "brightness_std": float(arr.std()),
-                "contrast": float(gray.std()),
-                "sharpness": float((gy**2 + gx**2).mean()),
-            }
-        )
-    return pd.DataFrame(rows)
+    if not image_paths:
+        return pd.DataFrame(columns=list(_FEATURE_COLUMNS))
+
+    # JPEG decode releases the GIL inside libjpeg, so threaded decode scales;
+    # everything after runs as vectorized reductions over one (N, H, W, 3)
+    # tensor instead of per-image Python loops.
+    with ThreadPoolExecutor(max_workers=min(8, len(image_paths))) as pool:
+        images = list(pool.map(_decode_bgr, image_paths))
+
+    if len({img.shape for img in images}) == 1:
+        return pd.DataFrame(_batch_features(np.stack(images).astype(np.float32)))
+
+    # Mixed dimensions: keep each image at native resolution (resizing would
+    # distort contrast/sharpness) and fall back to per-image batches of one,
+    # mirroring simulate_drift's heterogeneous-batch path.
+    frames = [_batch_features(img[None].astype(np.float32)) for img in images]
+    return pd.DataFrame(
+        {col: np.concatenate([f[col] for f in frames]) for col in _FEATURE_COLUMNS}
+    )
 
 
 def run_drift_report(
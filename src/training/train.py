@@ -42,14 +42,17 @@ _METRIC_ALIASES: dict[str, str] = {
 def parse_yolo_metrics(results_dict: dict) -> dict[str, float]:
     """Translate Ultralytics ``results_dict`` keys to clean MLflow metric names.
 
-    Unknown keys are ignored so the function remains forward-compatible with
-    new Ultralytics releases.
+    Unknown keys and non-numeric values are ignored so the function remains
+    forward-compatible with new Ultralytics releases.
     """
-    return {
-        clean: float(results_dict[raw])
-        for raw, clean in _METRIC_ALIASES.items()
-        if raw in results_dict
-    }
+    metrics: dict[str, float] = {}
+    # Intersect at C level rather than probing each alias individually.
+    for raw in _METRIC_ALIASES.keys() & results_dict.keys():
+        try:
+            metrics[_METRIC_ALIASES[raw]] = float(results_dict[raw])
+        except (TypeError, ValueError):
+            continue
+    return metrics
 
 
 def run_training(
@@ -0,0 +1,33 @@
+"""YAML loading helpers for the test suite.
+
+Every YAML read in the tests is a structural assertion — nothing is
+round-tripped back out — so all loads use SafeLoader semantics, through the
+libyaml C loader when the installed wheel carries it. Keeping the loader
+choice here (rather than per test module) also keeps FullLoader and
+round-trip loaders out of the test tree.
+"""
+
+from pathlib import Path
+
+import yaml
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# The loaders accept raw bytes, so files are read with read_bytes() — the
+# Python-level UTF-8 decode into a str would be redundant work.
+
+
+def load(path: Path) -> dict:
+    """Parse a single-document YAML file."""
+    return yaml.load(path.read_bytes(), Loader=Loader)
+
+
+def load_all(path: Path) -> list[dict]:
+    """Parse a multi-document YAML file, dropping empty documents."""
+    return [d for d in yaml.load_all(path.read_bytes(), Loader=Loader) if d is not None]
+
+
+def loads(text: str) -> dict:
+    """Parse YAML from an in-memory string."""
+    return yaml.load(text, Loader=Loader)
@@ -0,0 +1,54 @@
+"""Shared image-fixture helpers.
+
+These were previously re-defined per test module; consolidating them here
+means PIL/OpenCV are imported once per worker and the JPEG-encoding caches
+are shared across the whole suite.
+"""
+
+import functools
+import io
+import json
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PIL import Image
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+def load_json(path: Path) -> dict:
+    """Parse a JSON file — orjson consumes bytes directly (no UTF-8 decode
+    round-trip) when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+@functools.cache
+def jpeg_for(color: tuple[int, int, int], size: tuple[int, int] = (16, 16)) -> bytes:
+    """Encoded JPEG of a solid-color image — each distinct (color, size) is
+    encoded exactly once per session."""
+    arr = np.full((size[1], size[0], 3), color[::-1], dtype=np.uint8)  # BGR
+    return cv2.imencode(".jpg", arr)[1].tobytes()
+
+
+def save_image(
+    path: Path, color: tuple[int, int, int], size: tuple[int, int] = (16, 16)
+) -> None:
+    path.write_bytes(jpeg_for(color, size))
+
+
+def make_image(size: tuple[int, int] = (64, 64), value: int = 128) -> Image.Image:
+    arr = np.full((*size, 3), value, dtype=np.uint8)
+    return Image.fromarray(arr)
+
+
+@functools.lru_cache(maxsize=8)
+def jpeg_bytes(size: tuple[int, int] = (64, 64)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, color=(200, 100, 50)).save(buf, format="JPEG")
+    return buf.getvalue()
@@ -8,8 +8,10 @@ The only remaining mock is the edge-case test for a missing DatasetDriftMetric
 in Evidently's output — that branch cannot be exercised with real data.
 """
 
+import os
+import shutil
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
@@ -17,6 +19,7 @@ from PIL import Image as PILImage
 
 from src.data.drift_simulator import apply_brightness
 from src.monitoring.drift_detection import extract_image_features, run_drift_report
+from tests.conftest import save_image
 
 # ---------------------------------------------------------------------------
 # Real-data constants
@@ -30,17 +33,19 @@ HAS_DATASET = CASTING_VAL.exists() and len(list(CASTING_VAL.glob("*.jpg"))) >= 5
 # ---------------------------------------------------------------------------
 
 
-def _save_image(
-    path: Path, color: tuple[int, int, int], size: tuple[int, int] = (16, 16)
-) -> None:
-    PILImage.new("RGB", size, color=color).save(path)
-
-
 def _make_image_dir(base: Path, name: str, n: int, color: tuple[int, int, int]) -> Path:
+    """Write one image and hard-link the rest — every file is identical, so
+    n writes collapse to one write plus n-1 inode operations."""
     d = base / name
     d.mkdir()
-    for i in range(n):
-        _save_image(d / f"img_{i:03d}.jpg", color)
+    first = d / "img_000.jpg"
+    save_image(first, color)
+    for i in range(1, n):
+        target = d / f"img_{i:03d}.jpg"
+        try:
+            os.link(first, target)
+        except OSError:  # filesystem without hard links
+            shutil.copyfile(first, target)
     return d
 
 
@@ -52,7 +57,7 @@ def _make_image_dir(base: Path, name: str, n: int, color: tuple[int, int, int])
 class TestExtractImageFeatures:
     def test_returns_dataframe_with_correct_columns(self, tmp_path):
         img_path = tmp_path / "a.jpg"
-        _save_image(img_path, (128, 128, 128))
+        save_image(img_path, (128, 128, 128))
         df = extract_image_features([img_path])
         assert set(df.columns) == {
             "brightness_mean",
@@ -63,7 +68,7 @@ class TestExtractImageFeatures:
 
     def test_one_row_per_image(self, tmp_path):
         for i in range(5):
-            _save_image(tmp_path / f"img_{i}.jpg", (i * 40, i * 40, i * 40))
+            save_image(tmp_path / f"img_{i}.jpg", (i * 40, i * 40, i * 40))
         paths = sorted(tmp_path.glob("*.jpg"))
         df = extract_image_features(paths)
         assert len(df) == 5
@@ -75,21 +80,21 @@ class TestExtractImageFeatures:
     def test_bright_image_higher_mean_than_dark(self, tmp_path):
         bright = tmp_path / "bright.jpg"
         dark = tmp_path / "dark.jpg"
-        _save_image(bright, (240, 240, 240))
-        _save_image(dark, (10, 10, 10))
+        save_image(bright, (240, 240, 240))
+        save_image(dark, (10, 10, 10))
         df = extract_image_features([bright, dark])
         assert df.iloc[0]["brightness_mean"] > df.iloc[1]["brightness_mean"]
 
     def test_uniform_image_has_zero_contrast(self, tmp_path):
         img_path = tmp_path / "uniform.jpg"
-        _save_image(img_path, (200, 200, 200))
+        save_image(img_path, (200, 200, 200))
         df = extract_image_features([img_path])
         assert df.iloc[0]["contrast"] == pytest.approx(0.0, abs=1e-3)
 
     def test_sharpness_higher_for_edge_image(self, tmp_path):
         """An image with a sharp edge should have higher gradient energy."""
         flat = tmp_path / "flat.jpg"
-        _save_image(flat, (128, 128, 128))
+        save_image(flat, (128, 128, 128))
 
         arr = np.zeros((16, 16, 3), dtype=np.uint8)
         arr[:, 8:, :] = 255
@@ -101,7 +106,7 @@ class TestExtractImageFeatures:
 
     def test_values_are_finite(self, tmp_path):
         img_path = tmp_path / "img.jpg"
-        _save_image(img_path, (100, 150, 200))
+        save_image(img_path, (100, 150, 200))
         df = extract_image_features([img_path])
         assert df.notna().all().all()
 
@@ -216,16 +221,25 @@ class TestRunDriftReportRealData:
 
 
 class TestRunDriftReportEdgeCases:
-    def test_empty_metrics_returns_no_drift(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def empty_report_cls(self):
+        """A Report factory whose instances return no metrics.
+
+        Built once per class with plain spec'd Mocks — MagicMock's magic-method
+        scaffolding is unneeded here and noticeably heavier to construct.
+        """
+        inst = Mock(spec=["run", "as_dict"])
+        inst.as_dict.return_value = {"metrics": []}
+        return Mock(return_value=inst)
+
+    def test_empty_metrics_returns_no_drift(self, tmp_path, empty_report_cls):
         """When Evidently returns no metrics at all, safe default is returned."""
         cfg = tmp_path / "drift.yaml"
         cfg.write_text("drift:\n  min_reference_samples: 5\n  min_current_samples: 3\n")
         ref = _make_image_dir(tmp_path, "ref", n=6, color=(100, 100, 100))
         cur = _make_image_dir(tmp_path, "cur", n=4, color=(200, 200, 200))
 
-        mock_instance = MagicMock()
-        mock_instance.as_dict.return_value = {"metrics": []}
-        with patch("evidently.report.Report", MagicMock(return_value=mock_instance)):
+        with patch("evidently.report.Report", empty_report_cls):
             with patch("evidently.metric_preset.DataDriftPreset"):
                 result = run_drift_report(ref, cur, config_path=cfg)
 
@@ -1,6 +1,7 @@
 """Tests for src/data/drift_simulator.py"""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -13,22 +14,23 @@ from src.data.drift_simulator import (
     apply_noise,
     simulate_drift,
 )
+from tests.conftest import jpeg_for, make_image
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def make_image(size: tuple[int, int] = (64, 64), value: int = 128) -> Image.Image:
-    arr = np.full((*size, 3), value, dtype=np.uint8)
-    return Image.fromarray(arr)
-
-
 def make_processed_images(base: Path, n: int = 5, split: str = "val") -> Path:
     img_dir = base / "images" / split
     img_dir.mkdir(parents=True, exist_ok=True)
-    for i in range(n):
-        make_image().save(img_dir / f"img_{i:03d}.jpg")
+    blob = jpeg_for((128, 128, 128), (64, 64))
+    with ThreadPoolExecutor(max_workers=min(8, n)) as pool:
+        list(
+            pool.map(
+                lambda i: (img_dir / f"img_{i:03d}.jpg").write_bytes(blob), range(n)
+            )
+        )
     return base
 
 
@@ -41,24 +43,25 @@ class TestApplyBrightness:
     def test_darkens(self):
         img = make_image(value=128)
         result = apply_brightness(img, factor=0.5)
-        assert np.mean(np.array(result)) < np.mean(np.array(img))
+        assert np.asarray(result).mean() < np.asarray(img).mean()
 
     def test_brightens(self):
         img = make_image(value=64)
         result = apply_brightness(img, factor=2.0)
-        assert np.mean(np.array(result)) > np.mean(np.array(img))
+        assert np.asarray(result).mean() > np.asarray(img).mean()
 
     def test_clamps_to_valid_range(self):
         img = make_image(value=200)
         result = apply_brightness(img, factor=100.0)
-        arr = np.array(result)
+        arr = np.asarray(result)
         assert arr.max() <= 255
         assert arr.min() >= 0
 
     def test_identity_at_factor_one(self):
         img = make_image(value=100)
         result = apply_brightness(img, factor=1.0)
-        np.testing.assert_array_equal(np.array(result), np.array(img))
+        a, b = np.asarray(result), np.asarray(img)
+        assert a.shape == b.shape and (a == b).all()
 
 
 # ---------------------------------------------------------------------------
@@ -66,23 +69,31 @@ class TestApplyBrightness:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def rng() -> np.random.Generator:
+    """Seeded generator shared across the noise tests — deterministic and
+    pays RNG initialisation once."""
+    return np.random.default_rng(0)
+
+
 class TestApplyNoise:
-    def test_changes_pixel_values(self):
+    def test_changes_pixel_values(self, rng):
         img = make_image(value=128)
-        result = apply_noise(img, std=50.0)
-        assert not np.array_equal(np.array(img), np.array(result))
+        result = apply_noise(img, std=50.0, rng=rng)
+        assert not np.array_equal(np.asarray(img), np.asarray(result))
 
-    def test_output_in_valid_range(self):
+    def test_output_in_valid_range(self, rng):
         img = make_image(value=128)
-        result = apply_noise(img, std=50.0)
-        arr = np.array(result)
+        result = apply_noise(img, std=50.0, rng=rng)
+        arr = np.asarray(result)
         assert arr.max() <= 255
         assert arr.min() >= 0
 
-    def test_zero_std_is_identity(self):
+    def test_zero_std_is_identity(self, rng):
         img = make_image(value=100)
-        result = apply_noise(img, std=0.0)
-        np.testing.assert_array_equal(np.array(result), np.array(img))
+        result = apply_noise(img, std=0.0, rng=rng)
+        a, b = np.asarray(result), np.asarray(img)
+        assert a.shape == b.shape and (a == b).all()
 
 
 # ---------------------------------------------------------------------------
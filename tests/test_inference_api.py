@@ -1,25 +1,19 @@
 """Tests for src/inference/api.py"""
 
-import io
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
-from PIL import Image as PILImage
 
+from src.inference.api import app, get_loader
 from src.inference.model_loader import Detection
+from tests.conftest import jpeg_bytes
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _jpeg_bytes(size: tuple[int, int] = (64, 64)) -> bytes:
-    buf = io.BytesIO()
-    PILImage.new("RGB", size, color=(200, 100, 50)).save(buf, format="JPEG")
-    return buf.getvalue()
-
-
 def _single_detection() -> list[Detection]:
     return [
         Detection(
@@ -32,11 +26,12 @@ def _single_detection() -> list[Detection]:
 
 
 # ---------------------------------------------------------------------------
-# Fixtures — split so tests can mutate the mock directly
+# Fixtures — one module-scoped app/client; tests mutate the shared mock and an
+# autouse fixture restores its default state after every test
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def mock_loader():
     """A pre-loaded ModelLoader mock with one default detection."""
     loader = MagicMock()
@@ -45,26 +40,40 @@ def mock_loader():
     return loader
 
 
+@pytest.fixture(scope="module")
+def _shared_client(mock_loader):
+    """The single TestClient (and lifespan startup) for this module.
+
+    The mock loader is injected through FastAPI's dependency_overrides, so no
+    module patching or app rebuild is needed.
+    """
+    app.dependency_overrides[get_loader] = lambda: mock_loader
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_loader(mock_loader):
+    """Restore the shared loader's defaults between tests."""
+    yield
+    mock_loader.reset_mock()
+    mock_loader.is_loaded = True
+    mock_loader.predict.side_effect = None
+    mock_loader.predict.return_value = _single_detection()
+
+
 @pytest.fixture()
-def client(mock_loader):
+def client(_shared_client):
     """TestClient backed by mock_loader."""
-    with patch("src.inference.api._loader", mock_loader):
-        from src.inference.api import app
-
-        with TestClient(app) as c:
-            yield c
+    return _shared_client
 
 
 @pytest.fixture()
-def client_no_model():
+def client_no_model(_shared_client, mock_loader):
     """TestClient with no model loaded."""
-    loader = MagicMock()
-    loader.is_loaded = False
-    with patch("src.inference.api._loader", loader):
-        from src.inference.api import app
-
-        with TestClient(app) as c:
-            yield c
+    mock_loader.is_loaded = False
+    return _shared_client
 
 
 # ---------------------------------------------------------------------------
@@ -93,7 +102,7 @@ class TestPredict:
     def test_returns_detections(self, client):
         resp = client.post(
             "/predict",
-            files={"file": ("test.jpg", _jpeg_bytes(), "image/jpeg")},
+            files={"file": ("test.jpg", jpeg_bytes(), "image/jpeg")},
         )
         assert resp.status_code == 200
         body = resp.json()
@@ -106,7 +115,7 @@ class TestPredict:
     def test_503_when_no_model(self, client_no_model):
         resp = client_no_model.post(
             "/predict",
-            files={"file": ("test.jpg", _jpeg_bytes(), "image/jpeg")},
+            files={"file": ("test.jpg", jpeg_bytes(), "image/jpeg")},
         )
         assert resp.status_code == 503
 
@@ -114,7 +123,7 @@ class TestPredict:
         mock_loader.predict.side_effect = RuntimeError("inference failed")
         resp = client.post(
             "/predict",
-            files={"file": ("test.jpg", _jpeg_bytes(), "image/jpeg")},
+            files={"file": ("test.jpg", jpeg_bytes(), "image/jpeg")},
         )
         assert resp.status_code == 500
 
@@ -122,7 +131,7 @@ class TestPredict:
         mock_loader.predict.return_value = []
         resp = client.post(
             "/predict",
-            files={"file": ("test.jpg", _jpeg_bytes(), "image/jpeg")},
+            files={"file": ("test.jpg", jpeg_bytes(), "image/jpeg")},
         )
         assert resp.status_code == 200
         assert resp.json()["num_detections"] == 0
@@ -130,7 +139,7 @@ class TestPredict:
     def test_inference_time_present(self, client):
         resp = client.post(
             "/predict",
-            files={"file": ("test.jpg", _jpeg_bytes(), "image/jpeg")},
+            files={"file": ("test.jpg", jpeg_bytes(), "image/jpeg")},
         )
         assert "inference_time_ms" in resp.json()
 
@@ -3,29 +3,29 @@
 from pathlib import Path
 
 import pytest
-import yaml
+
+from tests import _yaml
 
 K8S_DIR = Path("k8s")
 COMPOSE_FILE = Path("docker-compose.yml")
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def _load_yaml(path: Path) -> list[dict]:
-    """Load one or more YAML documents from a file."""
-    docs = list(yaml.safe_load_all(path.read_text()))
-    return [d for d in docs if d is not None]
-
-
-def _all_manifests() -> list[tuple[str, dict]]:
-    """Collect (relative_path, parsed_doc) for every YAML in k8s/."""
-    result = []
-    for path in sorted(K8S_DIR.rglob("*.yaml")):
-        for doc in _load_yaml(path):
-            result.append((str(path), doc))
-    return result
+# Unit-test-only environments may not carry the manifests; skip those tests
+# (and the rglob walk) instead of erroring at collection.
+HAS_K8S = K8S_DIR.is_dir()
+HAS_COMPOSE = COMPOSE_FILE.exists()
+
+# (relative_path, parsed_doc) for every YAML in k8s/ — parsed once at import
+# so the parametrized tests below share a single parse instead of re-reading
+# the tree per decorator.
+_MANIFESTS = (
+    tuple(
+        (str(path), doc)
+        for path in sorted(K8S_DIR.rglob("*.yaml"))
+        for doc in _yaml.load_all(path)
+    )
+    if HAS_K8S
+    else ()
+)
 
 
 # ---------------------------------------------------------------------------
@@ -33,20 +33,21 @@ def _all_manifests() -> list[tuple[str, dict]]:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.skipif(not HAS_K8S, reason="k8s manifests not present")
 class TestManifestStructure:
-    @pytest.mark.parametrize("path,doc", _all_manifests())
+    @pytest.mark.parametrize("path,doc", _MANIFESTS)
     def test_has_api_version(self, path, doc):
         assert "apiVersion" in doc, f"{path}: missing apiVersion"
 
-    @pytest.mark.parametrize("path,doc", _all_manifests())
+    @pytest.mark.parametrize("path,doc", _MANIFESTS)
     def test_has_kind(self, path, doc):
         assert "kind" in doc, f"{path}: missing kind"
 
-    @pytest.mark.parametrize("path,doc", _all_manifests())
+    @pytest.mark.parametrize("path,doc", _MANIFESTS)
     def test_has_metadata_name(self, path, doc):
         assert "name" in doc.get("metadata", {}), f"{path}: missing metadata.name"
 
-    @pytest.mark.parametrize("path,doc", _all_manifests())
+    @pytest.mark.parametrize("path,doc", _MANIFESTS)
     def test_namespace_is_visionops(self, path, doc):
         kind = doc.get("kind", "")
         # Namespace resource itself defines the namespace — skip
@@ -61,24 +62,27 @@ class TestManifestStructure:
 # ---------------------------------------------------------------------------
 
 
+def _manifest(kind: str, path: Path) -> dict:
+    """Look up a parsed doc from _MANIFESTS instead of re-reading the file."""
+    return next(d for p, d in _MANIFESTS if p == str(path) and d.get("kind") == kind)
+
+
 @pytest.fixture(scope="module")
 def inference_deployment() -> dict:
-    docs = _load_yaml(K8S_DIR / "inference" / "deployment.yaml")
-    return next(d for d in docs if d.get("kind") == "Deployment")
+    return _manifest("Deployment", K8S_DIR / "inference" / "deployment.yaml")
 
 
 @pytest.fixture(scope="module")
 def inference_service() -> dict:
-    docs = _load_yaml(K8S_DIR / "inference" / "service.yaml")
-    return next(d for d in docs if d.get("kind") == "Service")
+    return _manifest("Service", K8S_DIR / "inference" / "service.yaml")
 
 
 @pytest.fixture(scope="module")
 def inference_hpa() -> dict:
-    docs = _load_yaml(K8S_DIR / "inference" / "hpa.yaml")
-    return next(d for d in docs if d.get("kind") == "HorizontalPodAutoscaler")
+    return _manifest("HorizontalPodAutoscaler", K8S_DIR / "inference" / "hpa.yaml")
 
 
+@pytest.mark.skipif(not HAS_K8S, reason="k8s manifests not present")
 class TestInferenceDeployment:
     def test_container_port_is_8000(self, inference_deployment):
         container = inference_deployment["spec"]["template"]["spec"]["containers"][0]
@@ -112,6 +116,7 @@ class TestInferenceDeployment:
             assert pod_labels.get(key) == val
 
 
+@pytest.mark.skipif(not HAS_K8S, reason="k8s manifests not present")
 class TestInferenceService:
     def test_selector_matches_deployment_label(self, inference_service):
         assert inference_service["spec"]["selector"]["app"] == "inference"
@@ -121,6 +126,7 @@ class TestInferenceService:
         assert any(p["targetPort"] == 8000 for p in ports)
 
 
+@pytest.mark.skipif(not HAS_K8S, reason="k8s manifests not present")
 class TestInferenceHPA:
     def test_targets_inference_deployment(self, inference_hpa):
         ref = inference_hpa["spec"]["scaleTargetRef"]
@@ -143,16 +149,15 @@ class TestInferenceHPA:
 
 @pytest.fixture(scope="module")
 def mlflow_deployment() -> dict:
-    docs = _load_yaml(K8S_DIR / "mlflow" / "deployment.yaml")
-    return next(d for d in docs if d.get("kind") == "Deployment")
+    return _manifest("Deployment", K8S_DIR / "mlflow" / "deployment.yaml")
 
 
 @pytest.fixture(scope="module")
 def mlflow_service() -> dict:
-    docs = _load_yaml(K8S_DIR / "mlflow" / "service.yaml")
-    return next(d for d in docs if d.get("kind") == "Service")
+    return _manifest("Service", K8S_DIR / "mlflow" / "service.yaml")
 
 
+@pytest.mark.skipif(not HAS_K8S, reason="k8s manifests not present")
 class TestMLflowDeployment:
     def test_container_port_is_5000(self, mlflow_deployment):
         container = mlflow_deployment["spec"]["template"]["spec"]["containers"][0]
@@ -173,6 +178,7 @@ class TestMLflowDeployment:
             assert pod_labels.get(key) == val
 
 
+@pytest.mark.skipif(not HAS_K8S, reason="k8s manifests not present")
 class TestMLflowService:
     def test_selector_matches_deployment_label(self, mlflow_service):
         assert mlflow_service["spec"]["selector"]["app"] == "mlflow"
@@ -189,9 +195,10 @@ class TestMLflowService:
 
 @pytest.fixture(scope="module")
 def compose() -> dict:
-    return yaml.safe_load(COMPOSE_FILE.read_text())
+    return _yaml.load(COMPOSE_FILE)
 
 
+@pytest.mark.skipif(not HAS_COMPOSE, reason="docker-compose.yml not present")
 class TestDockerCompose:
     def test_has_inference_service(self, compose):
         assert "inference" in compose["services"]
@@ -7,11 +7,15 @@ Integration tests (TestPrepareCastingDataset) use the real Casting product
 from data/raw/vision/ and are skipped when the dataset is not present.
 """
 
+import functools
+import hashlib
+import inspect
+import io
 import json
 from pathlib import Path
 
+import numpy as np
 import pytest
-import yaml
 from PIL import Image
 
 from src.data.prepare_dataset import (
@@ -20,6 +24,8 @@ from src.data.prepare_dataset import (
     prepare_dataset,
     process_split,
 )
+from tests import _yaml
+from tests.conftest import load_json
 
 # Real dataset paths
 CASTING_SRC = Path("data/raw/vision/Casting")
@@ -47,6 +53,14 @@ SAMPLE_ANNOTATION = {
 }
 
 
+@functools.cache
+def _blank_jpeg(width: int, height: int) -> bytes:
+    """One JPEG encode per distinct size — fixtures just copy the bytes."""
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height)).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
 def _write_coco_split(
     base: Path,
     product: str,
@@ -59,8 +73,8 @@ def _write_coco_split(
     split_dir.mkdir(parents=True, exist_ok=True)
 
     for img_info in images:
-        Image.new("RGB", (img_info["width"], img_info["height"])).save(
-            split_dir / img_info["file_name"]
+        (split_dir / img_info["file_name"]).write_bytes(
+            _blank_jpeg(img_info["width"], img_info["height"])
         )
 
     ann = {"images": images, "annotations": annotations, "categories": categories}
@@ -81,32 +95,53 @@ def make_minimal_dataset(tmp_path: Path, product: str = "PartA") -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def minimal_src(tmp_path_factory) -> Path:
+    """Minimal COCO dataset shared by every test that only reads from it —
+    the image encoding and JSON writes run once per session."""
+    return make_minimal_dataset(tmp_path_factory.mktemp("src"))
+
+
 # ---------------------------------------------------------------------------
 # coco_to_yolo
 # ---------------------------------------------------------------------------
 
 
 class TestCocoToYolo:
-    def test_centre_conversion(self):
-        # 100×100 box at origin in a 200×200 image
-        cx, cy, nw, nh = coco_to_yolo([0, 0, 100, 100], 200, 200)
-        assert cx == pytest.approx(0.25)
-        assert cy == pytest.approx(0.25)
-        assert nw == pytest.approx(0.5)
-        assert nh == pytest.approx(0.5)
-
-    def test_full_image_box(self):
-        cx, cy, nw, nh = coco_to_yolo([0, 0, 640, 480], 640, 480)
-        assert cx == pytest.approx(0.5)
-        assert cy == pytest.approx(0.5)
-        assert nw == pytest.approx(1.0)
-        assert nh == pytest.approx(1.0)
+    @pytest.mark.parametrize(
+        "bbox,w,h,expected",
+        [
+            # 100×100 box at origin in a 200×200 image
+            ([0, 0, 100, 100], 200, 200, (0.25, 0.25, 0.5, 0.5)),
+            # full-image box
+            ([0, 0, 640, 480], 640, 480, (0.5, 0.5, 1.0, 1.0)),
+            # off-centre box
+            ([20, 10, 60, 40], 200, 100, (0.25, 0.3, 0.3, 0.4)),
+        ],
+    )
+    def test_conversion(self, bbox, w, h, expected):
+        assert coco_to_yolo(bbox, w, h) == pytest.approx(expected)
 
     def test_clamps_out_of_bounds(self):
         cx, cy, nw, nh = coco_to_yolo([-10, -10, 700, 500], 640, 480)
         for v in (cx, cy, nw, nh):
             assert 0.0 <= v <= 1.0
 
+    def test_batch_matches_vectorized_reference(self):
+        """Sweep 10k random boxes against a NumPy reference in one shot —
+        catches clamp/centre bugs far beyond the hand-picked cases."""
+        rs = np.random.RandomState(0)
+        img_w, img_h = 640, 480
+        bboxes = rs.uniform(-50, 700, size=(10_000, 4))
+
+        out = np.array([coco_to_yolo(b, img_w, img_h) for b in bboxes.tolist()])
+        assert np.all((out >= 0.0) & (out <= 1.0))
+
+        scale = np.array([img_w, img_h, img_w, img_h], dtype=np.float64)
+        centres = bboxes[:, :2] + bboxes[:, 2:] / 2
+        ref = np.clip(np.hstack([centres, bboxes[:, 2:]]) / scale, 0.0, 1.0)
+        np.testing.assert_allclose(out, ref)
+
 
 # ---------------------------------------------------------------------------
 # build_class_map
@@ -160,30 +195,29 @@ class TestBuildClassMap:
 
 
 class TestProcessSplit:
-    def test_writes_image_and_label(self, tmp_path):
-        src = make_minimal_dataset(tmp_path / "src")
+    def test_writes_image_and_label(self, tmp_path, minimal_src):
         dst = tmp_path / "dst"
         class_map = {"defect": 0, "scratch": 1}
 
-        n = process_split("PartA", "train", class_map, src, dst)
+        n = process_split("PartA", "train", class_map, minimal_src, dst)
 
         assert n == 1
         assert (dst / "images" / "train" / "PartA_000000.jpg").exists()
         assert (dst / "labels" / "train" / "PartA_000000.txt").exists()
 
-    def test_label_format(self, tmp_path):
-        src = make_minimal_dataset(tmp_path / "src")
+    def test_label_format(self, tmp_path, minimal_src):
         dst = tmp_path / "dst"
         class_map = {"defect": 0, "scratch": 1}
 
-        process_split("PartA", "train", class_map, src, dst)
-        label = (dst / "labels" / "train" / "PartA_000000.txt").read_text().strip()
-        parts = label.split()
+        process_split("PartA", "train", class_map, minimal_src, dst)
+        arr = np.loadtxt(
+            dst / "labels" / "train" / "PartA_000000.txt", dtype=np.float64, ndmin=2
+        )
 
-        assert len(parts) == 5
-        assert parts[0] == "0"
-        for v in parts[1:]:
-            assert 0.0 <= float(v) <= 1.0
+        assert arr.shape == (1, 5)
+        assert arr[0, 0] == 0
+        coords = arr[:, 1:]
+        assert coords.min() >= 0.0 and coords.max() <= 1.0
 
     def test_missing_annotation_returns_zero(self, tmp_path):
         n = process_split("NoProduct", "train", {}, tmp_path, tmp_path / "dst")
@@ -196,26 +230,24 @@ class TestProcessSplit:
 
 
 class TestPrepareDataset:
-    def test_generates_dataset_yaml(self, tmp_path):
-        src = make_minimal_dataset(tmp_path / "src")
-        dst = tmp_path / "dst"
-
-        yaml_path = prepare_dataset(src, dst)
+    @pytest.fixture(scope="class")
+    def prepared_minimal(self, minimal_src, tmp_path_factory) -> Path:
+        """Run prepare_dataset once for the read-only assertions below."""
+        dst = tmp_path_factory.mktemp("minimal_out")
+        prepare_dataset(minimal_src, dst)
+        return dst
 
+    def test_generates_dataset_yaml(self, prepared_minimal):
+        yaml_path = prepared_minimal / "dataset.yaml"
         assert yaml_path.exists()
-        config = yaml.safe_load(yaml_path.read_text())
+        config = _yaml.load(yaml_path)
         assert config["nc"] == 2
         assert "train" in config
         assert "val" in config
 
-    def test_names_list_matches_class_map(self, tmp_path):
-        src = make_minimal_dataset(tmp_path / "src")
-        dst = tmp_path / "dst"
-
-        prepare_dataset(src, dst)
-
-        class_map = json.loads((dst / "class_map.json").read_text())
-        config = yaml.safe_load((dst / "dataset.yaml").read_text())
+    def test_names_list_matches_class_map(self, prepared_minimal):
+        class_map = load_json(prepared_minimal / "class_map.json")
+        config = _yaml.load(prepared_minimal / "dataset.yaml")
         assert len(config["names"]) == len(class_map)
 
     def test_raises_on_missing_source(self, tmp_path):
@@ -228,61 +260,87 @@ class TestPrepareDataset:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group("casting")
 @pytest.mark.skipif(not HAS_CASTING, reason="Casting dataset not found")
 class TestPrepareCastingDataset:
     """Run the full COCO→YOLO pipeline against the real Casting product and
-    verify it produces the correct classes, image counts, and file layout."""
+    verify it produces the correct classes, image counts, and file layout.
+
+    Under ``pytest -n auto --dist loadgroup`` the whole class lands on one
+    worker, so the class-scoped conversion still runs exactly once.
+    """
 
     @pytest.fixture(scope="class")
-    def prepared(self, tmp_path_factory) -> Path:
-        """Convert Casting once and share the output across all tests."""
-        dst = tmp_path_factory.mktemp("casting_out")
-        prepare_dataset(
-            src_dir=CASTING_SRC.parent,  # data/raw/vision/
-            dst_dir=dst,
-            products=["Casting"],
-        )
+    def prepared(self, pytestconfig) -> Path:
+        """Convert Casting once per machine, not once per session.
+
+        The output lives under .pytest_cache keyed by a hash of the source
+        files' paths and mtimes plus the converter's own source, so repeat
+        runs skip the COCO→YOLO conversion until either the raw data or
+        prepare_dataset.py changes.
+        """
+        digest = hashlib.sha256()
+        digest.update(Path(inspect.getfile(prepare_dataset)).read_bytes())
+        for p in sorted(CASTING_SRC.rglob("*")):
+            digest.update(str(p).encode())
+            digest.update(str(p.stat().st_mtime_ns).encode())
+        dst = Path(pytestconfig.cache.mkdir(f"casting-{digest.hexdigest()[:16]}"))
+        if not (dst / "dataset.yaml").exists():
+            prepare_dataset(
+                src_dir=CASTING_SRC.parent,  # data/raw/vision/
+                dst_dir=dst,
+                products=["Casting"],
+            )
         return dst
 
     def test_dataset_yaml_exists(self, prepared):
         assert (prepared / "dataset.yaml").exists()
 
     def test_class_count_is_two(self, prepared):
-        cfg = yaml.safe_load((prepared / "dataset.yaml").read_text())
+        cfg = _yaml.load(prepared / "dataset.yaml")
         assert cfg["nc"] == 2
 
     def test_class_names_match_casting_categories(self, prepared):
-        cfg = yaml.safe_load((prepared / "dataset.yaml").read_text())
+        cfg = _yaml.load(prepared / "dataset.yaml")
         assert set(cfg["names"]) == {"inclusoes", "rechupe"}
 
     def test_class_map_written(self, prepared):
-        class_map = json.loads((prepared / "class_map.json").read_text())
+        class_map = load_json(prepared / "class_map.json")
         assert set(class_map.keys()) == {"inclusoes", "rechupe"}
 
-    def test_training_images_count(self, prepared):
-        imgs = list((prepared / "images" / "train").glob("*.jpg"))
-        assert len(imgs) == 54
+    @pytest.fixture(scope="class")
+    def listings(self, prepared) -> dict[str, list[Path]]:
+        """One readdir per output directory, shared by the count tests —
+        Path.iterdir avoids both the rewalk and glob's fnmatch overhead."""
+        return {
+            "train_imgs": list((prepared / "images" / "train").iterdir()),
+            "val_imgs": list((prepared / "images" / "val").iterdir()),
+            "train_labels": list((prepared / "labels" / "train").iterdir()),
+            "val_labels": list((prepared / "labels" / "val").iterdir()),
+        }
+
+    def test_training_images_count(self, listings):
+        assert len(listings["train_imgs"]) == 54
 
-    def test_val_images_count(self, prepared):
-        imgs = list((prepared / "images" / "val").glob("*.jpg"))
-        assert len(imgs) == 51
+    def test_val_images_count(self, listings):
+        assert len(listings["val_imgs"]) == 51
 
-    def test_label_files_created_for_train(self, prepared):
-        labels = list((prepared / "labels" / "train").glob("*.txt"))
-        assert len(labels) == 54
+    def test_label_files_created_for_train(self, listings):
+        assert len(listings["train_labels"]) == 54
 
-    def test_label_files_created_for_val(self, prepared):
-        labels = list((prepared / "labels" / "val").glob("*.txt"))
-        assert len(labels) == 51
+    def test_label_files_created_for_val(self, listings):
+        assert len(listings["val_labels"]) == 51
 
     def test_label_format_valid(self, prepared):
         """Spot-check: every label line has 5 floats with values in [0, 1]."""
         label_files = sorted((prepared / "labels" / "train").glob("*.txt"))
         for lf in label_files[:10]:  # check first 10
-            for line in lf.read_text().strip().splitlines():
-                parts = line.split()
-                assert len(parts) == 5, f"bad label line in {lf}: {line!r}"
-                cls_id = int(parts[0])
-                assert cls_id in (0, 1), f"unexpected class id {cls_id}"
-                for v in parts[1:]:
-                    assert 0.0 <= float(v) <= 1.0, f"out-of-range coord in {lf}: {v}"
+            arr = np.loadtxt(lf, dtype=np.float64, ndmin=2)
+            assert arr.shape[1] == 5, f"bad label shape in {lf}: {arr.shape}"
+            assert np.isin(arr[:, 0].astype(int), [0, 1]).all(), (
+                f"unexpected class id in {lf}"
+            )
+            coords = arr[:, 1:]
+            assert coords.min() >= 0.0 and coords.max() <= 1.0, (
+                f"out-of-range coord in {lf}"
+            )
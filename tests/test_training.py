@@ -1,10 +1,20 @@
 """Tests for src/training/train.py and src/training/mlflow_utils.py."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-from src.training.train import parse_yolo_metrics
+pytest.importorskip("mlflow")
+
+# Under pytest -n auto --dist loadgroup the whole module stays on one worker,
+# so only that worker pays the mlflow import cost.
+pytestmark = pytest.mark.xdist_group("training_unit")
+
+from src.training.mlflow_utils import (  # noqa: E402
+    promote_to_production,
+    register_to_staging,
+)
+from src.training.train import parse_yolo_metrics  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # parse_yolo_metrics  (pure function — no mocking needed)
@@ -12,18 +22,18 @@ from src.training.train import parse_yolo_metrics
 
 
 class TestParseYoloMetrics:
-    def test_translates_known_keys(self):
-        raw = {
-            "metrics/mAP50(B)": 0.55,
-            "metrics/mAP50-95(B)": 0.32,
-            "metrics/precision(B)": 0.71,
-            "metrics/recall(B)": 0.68,
-        }
-        metrics = parse_yolo_metrics(raw)
-        assert metrics["map50"] == pytest.approx(0.55)
-        assert metrics["map50_95"] == pytest.approx(0.32)
-        assert metrics["precision"] == pytest.approx(0.71)
-        assert metrics["recall"] == pytest.approx(0.68)
+    # (raw YOLO key, parsed key, value) — built once at import
+    _KNOWN = (
+        ("metrics/mAP50(B)", "map50", 0.55),
+        ("metrics/mAP50-95(B)", "map50_95", 0.32),
+        ("metrics/precision(B)", "precision", 0.71),
+        ("metrics/recall(B)", "recall", 0.68),
+    )
+
+    @pytest.mark.parametrize("raw_key,out_key,val", _KNOWN)
+    def test_translates_known_key(self, raw_key, out_key, val):
+        # float(v) on a float is lossless, so exact equality is safe here
+        assert parse_yolo_metrics({raw_key: val})[out_key] == val
 
     def test_ignores_unknown_keys(self):
         raw = {"metrics/mAP50(B)": 0.4, "some/unknown_key": 99.0}
@@ -39,6 +49,12 @@ class TestParseYoloMetrics:
         raw = {"metrics/mAP50(B)": "0.45"}
         metrics = parse_yolo_metrics(raw)
         assert isinstance(metrics["map50"], float)
+        assert metrics["map50"] == 0.45
+
+
+# Single patch target — patch.multiple resolves the module once and swaps
+# both attributes in one descent instead of two dotted-string lookups.
+_MLFLOW_UTILS = "src.training.mlflow_utils"
 
 
 # ---------------------------------------------------------------------------
@@ -50,38 +66,50 @@ class TestPromoteToProduction:
     _TRACKING_URI = "http://localhost:5000"
     _MODEL_NAME = "visionops-yolov8n"
 
-    def _call(self, map50: float, threshold: float = 0.30) -> bool:
-        from src.training.mlflow_utils import promote_to_production
-
-        with (
-            patch("src.training.mlflow_utils.mlflow.set_tracking_uri"),
-            patch("src.training.mlflow_utils.MlflowClient") as mock_client_cls,
+    @pytest.fixture(scope="class", autouse=True)
+    def _mlflow_mocks(self, request):
+        """Patch MLflow once per class — entering the patch contexts per
+        test was the bulk of this class's runtime.
+
+        Plain spec'd Mocks instead of MagicMock: the tests only touch
+        set_registered_model_alias, and the spec catches attribute typos.
+        """
+        mock_client = Mock(spec_set=["set_registered_model_alias"])
+        with patch.multiple(
+            _MLFLOW_UTILS,
+            mlflow=Mock(),
+            MlflowClient=Mock(return_value=mock_client),
         ):
-            mock_client = MagicMock()
-            mock_client_cls.return_value = mock_client
-            result = promote_to_production(
-                self._MODEL_NAME, 1, map50, threshold, self._TRACKING_URI
-            )
-            return result, mock_client
-
-    def test_promotes_when_above_threshold(self):
-        result, mock_client = self._call(map50=0.45)
-        assert result is True
-        mock_client.set_registered_model_alias.assert_called_once()
-
-    def test_skips_when_below_threshold(self):
-        result, mock_client = self._call(map50=0.10)
-        assert result is False
-        mock_client.set_registered_model_alias.assert_not_called()
-
-    def test_promotes_when_equal_to_threshold(self):
-        # Threshold is a minimum — exactly meeting it should promote
-        result, mock_client = self._call(map50=0.30, threshold=0.30)
-        assert result is True
+            request.cls.mock_client = mock_client
+            yield
+
+    @pytest.fixture(autouse=True)
+    def _reset_client(self):
+        """Keep tests isolated without re-patching."""
+        yield
+        self.mock_client.reset_mock()
+
+    def _call(self, map50: float, threshold: float = 0.30) -> bool:
+        return promote_to_production(
+            self._MODEL_NAME, 1, map50, threshold, self._TRACKING_URI
+        )
+
+    @pytest.mark.parametrize(
+        "map50,threshold,expected,call_count",
+        [
+            (0.45, 0.30, True, 1),
+            (0.10, 0.30, False, 0),
+            # Threshold is a minimum — exactly meeting it should promote
+            (0.30, 0.30, True, 1),
+        ],
+    )
+    def test_threshold_decision(self, map50, threshold, expected, call_count):
+        assert self._call(map50=map50, threshold=threshold) is expected
+        assert self.mock_client.set_registered_model_alias.call_count == call_count
 
     def test_sets_production_alias(self):
-        _, mock_client = self._call(map50=0.50)
-        call_args = mock_client.set_registered_model_alias.call_args
+        self._call(map50=0.50)
+        call_args = self.mock_client.set_registered_model_alias.call_args
         assert call_args.args[1] == "production"
 
 
@@ -91,46 +119,31 @@ class TestPromoteToProduction:
 
 
 class TestRegisterToStaging:
-    def test_returns_version_number(self):
-        from src.training.mlflow_utils import register_to_staging
-
-        mock_mv = MagicMock()
+    @pytest.fixture(scope="class", autouse=True)
+    def _mlflow_mocks(self, request):
+        """Patch MLflow once per class; register_model returns version 3."""
+        mock_mv = Mock(spec_set=["version"])
         mock_mv.version = "3"
-
-        with (
-            patch("src.training.mlflow_utils.mlflow.set_tracking_uri"),
-            patch(
-                "src.training.mlflow_utils.mlflow.register_model",
-                return_value=mock_mv,
-            ),
-            patch("src.training.mlflow_utils.MlflowClient") as mock_client_cls,
+        mock_mlflow = Mock()
+        mock_mlflow.register_model.return_value = mock_mv
+        mock_client = Mock(spec_set=["set_registered_model_alias"])
+        with patch.multiple(
+            _MLFLOW_UTILS,
+            mlflow=mock_mlflow,
+            MlflowClient=Mock(return_value=mock_client),
         ):
-            mock_client = MagicMock()
-            mock_client_cls.return_value = mock_client
-
-            version = register_to_staging(
-                "run-abc", "my-model", "http://localhost:5000"
-            )
-
+            request.cls.mock_client = mock_client
+            yield
+
+    @pytest.fixture(autouse=True)
+    def _reset_client(self):
+        yield
+        self.mock_client.reset_mock()
+
+    def test_registers_and_sets_staging_alias(self):
+        """One registration call, both contract checks: the returned version
+        and the staging alias set on it."""
+        version = register_to_staging("run-abc", "my-model", "http://localhost:5000")
         assert version == 3
-
-    def test_sets_staging_alias(self):
-        from src.training.mlflow_utils import register_to_staging
-
-        mock_mv = MagicMock()
-        mock_mv.version = "1"
-
-        with (
-            patch("src.training.mlflow_utils.mlflow.set_tracking_uri"),
-            patch(
-                "src.training.mlflow_utils.mlflow.register_model",
-                return_value=mock_mv,
-            ),
-            patch("src.training.mlflow_utils.MlflowClient") as mock_client_cls,
-        ):
-            mock_client = MagicMock()
-            mock_client_cls.return_value = mock_client
-
-            register_to_staging("run-abc", "my-model", "http://localhost:5000")
-            call_args = mock_client.set_registered_model_alias.call_args
-            assert call_args.args[1] == "staging"
+        call_args = self.mock_client.set_registered_model_alias.call_args
+        assert call_args.args[1] == "staging"